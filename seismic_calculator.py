@@ -12,15 +12,12 @@ without prior written permission from the author.
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
 from io import BytesIO
 import datetime
-
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage
-from reportlab.lib.colors import lightgrey
-from reportlab.lib.units import inch
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # ==============================
 # OWNER DETAILS
@@ -31,14 +28,12 @@ INSTITUTE_NAME = "VK Institute"
 # ==============================
 # SESSION STATE INIT (CRITICAL FIX)
 # ==============================
-if "numeric_result" not in st.session_state:
-    st.session_state["numeric_result"] = {}
-
-if "values" not in st.session_state:
-    st.session_state["values"] = {}
-
-if "graph_image" not in st.session_state:
-    st.session_state["graph_image"] = None
+st.session_state.setdefault("numeric_result", {})
+st.session_state.setdefault("values", {})
+st.session_state.setdefault("formula_text", "")
+st.session_state.setdefault("year", None)
+st.session_state.setdefault("distribution", None)
+st.session_state.setdefault("pdf_future", None)
 
 # ==============================
 # YEAR DESCRIPTIONS (SHORT, FROM INFOGRAPHICS)
@@ -122,6 +117,120 @@ YEAR_DESCRIPTIONS = {
     }
 }
 
+YEARS = tuple(YEAR_DESCRIPTIONS)
+
+# ==============================
+# FORMULAS (PURE, CACHED ON INPUTS)
+# ==============================
+@st.cache_data(show_spinner=False)
+def f_1962(ah, W):
+    return ah * W
+
+
+@st.cache_data(show_spinner=False)
+def vb_1966(C, ah, W):
+    return C * ah * W
+
+
+@st.cache_data(show_spinner=False)
+def vb_1970(C, ah, beta, W):
+    return C * ah * beta * W
+
+
+@st.cache_data(show_spinner=False)
+def vb_1975(C, beta, I, ao, W):
+    return C * beta * I * ao * W
+
+
+@st.cache_data(show_spinner=False)
+def vb_1984(K, C, beta, I, ao, W):
+    return K * C * beta * I * ao * W
+
+
+@st.cache_data(show_spinner=False)
+def vb_2002(Z, I, R, Sa_g, W):
+    return (Z / 2.0) * (I / R) * Sa_g * W
+
+
+@st.cache_data(show_spinner=False)
+def vbd_2025(Z, I, R, A_NH, A_NV, W):
+    return (Z * I * A_NH / R) * W, (Z * I * A_NV) * W
+
+
+# ==============================
+# YEAR SPECIFICATIONS (FORMULA, INPUTS, COMPUTE)
+# ==============================
+# Each input is (value key, widget label, YEAR_DESCRIPTIONS variable key, default)
+IN_AH = ("ah", "Horizontal Seismic Coefficient (ah)", "ah", 0.0)
+IN_C = ("C", "Flexibility Coefficient (C)", "C", 0.0)
+IN_BETA = ("beta", "Soil Foundation Factor (beta)", "beta", 0.0)
+IN_I = ("I", "Importance Factor (I)", "I", 1.0)
+IN_AO = ("ao", "Basic Horizontal Seismic Coefficient (ao)", "ao", 0.0)
+IN_K = ("K", "Performance Factor (K)", "K", 0.0)
+IN_W = ("W (kN)", "Seismic Weight W (kN)", "W", 0.0)
+
+SPEC_DYNAMIC = {
+    "formula": "Vb = (Z / 2) × (I / R) × (Sa/g) × W",
+    "inputs": [
+        ("Z", "Seismic Zone Factor (Z)", "Z", 0.0),
+        IN_I,
+        ("R", "Response Reduction Factor (R)", "R", 1.0),
+        ("Sa/g", "Spectral Acceleration Ratio (Sa/g)", "Sa/g", 0.0),
+        IN_W,
+    ],
+    "compute": vb_2002,
+    "results": ("Vb (kN)",),
+}
+
+# "compute" takes the inputs positionally, in "inputs" order
+YEAR_SPECS = {
+    1962: {
+        "formula": "F = ah × W",
+        "inputs": [IN_AH, IN_W],
+        "compute": f_1962,
+        "results": ("F (kN)",),
+    },
+    1966: {
+        "formula": "Vb = C × ah × W",
+        "inputs": [IN_C, IN_AH, IN_W],
+        "compute": vb_1966,
+        "results": ("Vb (kN)",),
+    },
+    1970: {
+        "formula": "Vb = C × ah × β × W",
+        "inputs": [IN_C, IN_AH, IN_BETA, IN_W],
+        "compute": vb_1970,
+        "results": ("Vb (kN)",),
+    },
+    1975: {
+        "formula": "Vb = C × β × I × a₀ × W",
+        "inputs": [IN_C, IN_BETA, IN_I, IN_AO, IN_W],
+        "compute": vb_1975,
+        "results": ("Vb (kN)",),
+    },
+    1984: {
+        "formula": "Vb = K × C × β × I × a₀ × W",
+        "inputs": [IN_K, IN_C, IN_BETA, IN_I, IN_AO, IN_W],
+        "compute": vb_1984,
+        "results": ("Vb (kN)",),
+    },
+    2002: SPEC_DYNAMIC,
+    2016: SPEC_DYNAMIC,
+    2025: {
+        "formula": "VBD,H = (Z × I × A_NH / R) × W   |   VBD,V = (Z × I × A_NV) × W",
+        "inputs": [
+            ("Z", "Hazard Factor (Z)", "Z", 0.0),
+            IN_I,
+            ("R", "Ductility Factor (R)", "R", 1.0),
+            ("A_NH", "Horizontal Response Coefficient (A_NH)", "A_NH", 0.0),
+            ("A_NV", "Vertical Response Coefficient (A_NV)", "A_NV", 0.0),
+            IN_W,
+        ],
+        "compute": vbd_2025,
+        "results": ("VBD,H (kN)", "VBD,V (kN)"),
+    },
+}
+
 # ==============================
 # PAGE CONFIG
 # ==============================
@@ -137,7 +246,12 @@ st.warning(
 st.title("IS 1893 Seismic Base Shear Calculator (1962–2025)")
 st.caption("Author: Vrushali Kamalakar | Enter W in kN. Results in kN.")
 
-user_tag = st.text_input("User Name / ID (for report)", value="")
+def _clear_pdf():
+    # The finished report embeds the user, so a new name needs a new build
+    st.session_state["pdf_future"] = None
+
+
+user_tag = st.text_input("User Name / ID (for report)", value="", on_change=_clear_pdf)
 
 st.divider()
 
@@ -146,7 +260,7 @@ st.divider()
 # ==============================
 st.subheader("Evolution Timeline of IS 1893")
 
-timeline_data = [
+timeline_data = (
     ("1962", "Foundation of seismic design\nIntroduced ah", "#1f77b4"),
     ("1966", "Flexibility in building response\nIntroduced C", "#2ca02c"),
     ("1970", "Soil–structure interaction\nIntroduced β", "#ff7f0e"),
@@ -155,25 +269,39 @@ timeline_data = [
     ("2002", "Dynamic design approach\nZ, R and Sa/g based", "#8c564b"),
     ("2016", "Refinement of dynamic provisions", "#17becf"),
     ("2025", "Separate horizontal & vertical forces", "#e377c2"),
-]
+)
+
+
+@st.cache_data
+def _build_timeline_png() -> bytes:
+    # Static figure: render once and reuse the PNG on every rerun
+    # Matplotlib is only needed here, so it is imported on the first (uncached) call
+    import matplotlib
+    matplotlib.use("Agg")  # headless server: no GUI backend probing
+    import matplotlib.pyplot as plt
+
+    fig_tl, ax_tl = plt.subplots(figsize=(8, 6))
+    y_positions = np.arange(len(timeline_data), 0, -1)
 
-fig_tl, ax_tl = plt.subplots(figsize=(8, 6))
-y_positions = list(range(len(timeline_data), 0, -1))
+    for (year_lbl, text, color), y in zip(timeline_data, y_positions):
+        ax_tl.text(0.1, y, year_lbl, fontsize=12, fontweight="bold",
+                   color="black", ha="right", va="center")
+        ax_tl.text(0.15, y, text, fontsize=10, color="white",
+                   ha="left", va="center",
+                   bbox=dict(boxstyle="round,pad=0.4", facecolor=color, edgecolor="black"))
 
-for (year_lbl, text, color), y in zip(timeline_data, y_positions):
-    ax_tl.text(0.1, y, year_lbl, fontsize=12, fontweight="bold",
-               color="black", ha="right", va="center")
-    ax_tl.text(0.15, y, text, fontsize=10, color="white",
-               ha="left", va="center",
-               bbox=dict(boxstyle="round,pad=0.4", facecolor=color, edgecolor="black"))
+    ax_tl.plot([0.12, 0.12], [0.5, len(timeline_data) + 0.5], color="black", linewidth=2)
+    ax_tl.set_xlim(0, 1)
+    ax_tl.set_ylim(0.5, len(timeline_data) + 0.5)
+    ax_tl.axis("off")
 
-ax_tl.plot([0.12, 0.12], [0.5, len(timeline_data) + 0.5], color="black", linewidth=2)
-ax_tl.set_xlim(0, 1)
-ax_tl.set_ylim(0.5, len(timeline_data) + 0.5)
-ax_tl.axis("off")
+    buf = BytesIO()
+    fig_tl.savefig(buf, format="png", dpi=120)
+    plt.close(fig_tl)
+    return buf.getvalue()
 
-st.pyplot(fig_tl)
-plt.close(fig_tl)
+
+st.image(_build_timeline_png())
 
 st.divider()
 
@@ -182,181 +310,43 @@ st.divider()
 # ==============================
 year = st.radio(
     "Select Code Year",
-    [1962, 1966, 1970, 1975, 1984, 2002, 2016, 2025],
+    YEARS,
     horizontal=True
 )
 
-st.info(YEAR_DESCRIPTIONS[year]["summary"])
-
-# ==============================
-# VARIABLES
-# ==============================
-formula_text = ""
+description = YEAR_DESCRIPTIONS[year]
+st.info(description["summary"])
 
 # ==============================
 # INPUT + CALCULATION (SESSION SAFE)
 # ==============================
-if year == 1962:
-    formula_text = "F = ah × W"
-
-    ah = st.number_input("Horizontal Seismic Coefficient (ah)",
-                         help=YEAR_DESCRIPTIONS[1962]["variables"]["ah"],
-                         value=0.0)
-    W = st.number_input("Seismic Weight W (kN)",
-                        help=YEAR_DESCRIPTIONS[1962]["variables"]["W"],
-                        value=0.0)
-
-    if st.button("Calculate"):
-        F = ah * W
-        st.session_state["numeric_result"] = {"F (kN)": F}
-        st.session_state["values"] = {"ah": ah, "W (kN)": W}
-
-elif year == 1966:
-    formula_text = "Vb = C × ah × W"
-
-    C = st.number_input("Flexibility Coefficient (C)",
-                        help=YEAR_DESCRIPTIONS[1966]["variables"]["C"],
-                        value=0.0)
-    ah = st.number_input("Horizontal Seismic Coefficient (ah)",
-                         help=YEAR_DESCRIPTIONS[1966]["variables"]["ah"],
-                         value=0.0)
-    W = st.number_input("Seismic Weight W (kN)",
-                        help=YEAR_DESCRIPTIONS[1966]["variables"]["W"],
-                        value=0.0)
-
-    if st.button("Calculate"):
-        Vb = C * ah * W
-        st.session_state["numeric_result"] = {"Vb (kN)": Vb}
-        st.session_state["values"] = {"C": C, "ah": ah, "W (kN)": W}
-
-elif year == 1970:
-    formula_text = "Vb = C × ah × β × W"
-
-    C = st.number_input("Flexibility Coefficient (C)",
-                        help=YEAR_DESCRIPTIONS[1970]["variables"]["C"],
-                        value=0.0)
-    ah = st.number_input("Horizontal Seismic Coefficient (ah)",
-                         help=YEAR_DESCRIPTIONS[1970]["variables"]["ah"],
-                         value=0.0)
-    beta = st.number_input("Soil Foundation Factor (beta)",
-                           help=YEAR_DESCRIPTIONS[1970]["variables"]["beta"],
-                           value=0.0)
-    W = st.number_input("Seismic Weight W (kN)",
-                        help=YEAR_DESCRIPTIONS[1970]["variables"]["W"],
-                        value=0.0)
-
-    if st.button("Calculate"):
-        Vb = C * ah * beta * W
-        st.session_state["numeric_result"] = {"Vb (kN)": Vb}
-        st.session_state["values"] = {"C": C, "ah": ah, "beta": beta, "W (kN)": W}
-
-elif year == 1975:
-    formula_text = "Vb = C × β × I × a₀ × W"
-
-    C = st.number_input("Flexibility Coefficient (C)",
-                        help=YEAR_DESCRIPTIONS[1975]["variables"]["C"],
-                        value=0.0)
-    beta = st.number_input("Soil Foundation Factor (beta)",
-                           help=YEAR_DESCRIPTIONS[1975]["variables"]["beta"],
-                           value=0.0)
-    I = st.number_input("Importance Factor (I)",
-                        help=YEAR_DESCRIPTIONS[1975]["variables"]["I"],
-                        value=1.0)
-    ao = st.number_input("Basic Horizontal Seismic Coefficient (ao)",
-                         help=YEAR_DESCRIPTIONS[1975]["variables"]["ao"],
-                         value=0.0)
-    W = st.number_input("Seismic Weight W (kN)",
-                        help=YEAR_DESCRIPTIONS[1975]["variables"]["W"],
-                        value=0.0)
-
-    if st.button("Calculate"):
-        Vb = C * beta * I * ao * W
-        st.session_state["numeric_result"] = {"Vb (kN)": Vb}
-        st.session_state["values"] = {"C": C, "beta": beta, "I": I, "ao": ao, "W (kN)": W}
-
-elif year == 1984:
-    formula_text = "Vb = K × C × β × I × a₀ × W"
-
-    K = st.number_input("Performance Factor (K)",
-                        help=YEAR_DESCRIPTIONS[1984]["variables"]["K"],
-                        value=0.0)
-    C = st.number_input("Flexibility Coefficient (C)",
-                        help=YEAR_DESCRIPTIONS[1984]["variables"]["C"],
-                        value=0.0)
-    beta = st.number_input("Soil Foundation Factor (beta)",
-                           help=YEAR_DESCRIPTIONS[1984]["variables"]["beta"],
-                           value=0.0)
-    I = st.number_input("Importance Factor (I)",
-                        help=YEAR_DESCRIPTIONS[1984]["variables"]["I"],
-                        value=1.0)
-    ao = st.number_input("Basic Horizontal Seismic Coefficient (ao)",
-                         help=YEAR_DESCRIPTIONS[1984]["variables"]["ao"],
-                         value=0.0)
-    W = st.number_input("Seismic Weight W (kN)",
-                        help=YEAR_DESCRIPTIONS[1984]["variables"]["W"],
-                        value=0.0)
-
-    if st.button("Calculate"):
-        Vb = K * C * beta * I * ao * W
-        st.session_state["numeric_result"] = {"Vb (kN)": Vb}
-        st.session_state["values"] = {"K": K, "C": C, "beta": beta, "I": I, "ao": ao, "W (kN)": W}
-
-elif year in [2002, 2016]:
-    formula_text = "Vb = (Z / 2) × (I / R) × (Sa/g) × W"
-
-    Z = st.number_input("Seismic Zone Factor (Z)",
-                        help=YEAR_DESCRIPTIONS[year]["variables"]["Z"],
-                        value=0.0)
-    I = st.number_input("Importance Factor (I)",
-                        help=YEAR_DESCRIPTIONS[year]["variables"]["I"],
-                        value=1.0)
-    R = st.number_input("Response Reduction Factor (R)",
-                        help=YEAR_DESCRIPTIONS[year]["variables"]["R"],
-                        value=1.0)
-    Sa_g = st.number_input("Spectral Acceleration Ratio (Sa/g)",
-                           help=YEAR_DESCRIPTIONS[year]["variables"]["Sa/g"],
-                           value=0.0)
-    W = st.number_input("Seismic Weight W (kN)",
-                        help=YEAR_DESCRIPTIONS[year]["variables"]["W"],
-                        value=0.0)
-
-    if st.button("Calculate"):
-        Vb = (Z / 2.0) * (I / R) * Sa_g * W
-        st.session_state["numeric_result"] = {"Vb (kN)": Vb}
-        st.session_state["values"] = {"Z": Z, "I": I, "R": R, "Sa/g": Sa_g, "W (kN)": W}
-
-elif year == 2025:
-    formula_text = "VBD,H = (Z × I × A_NH / R) × W   |   VBD,V = (Z × I × A_NV) × W"
-
-    Z = st.number_input("Hazard Factor (Z)",
-                        help=YEAR_DESCRIPTIONS[2025]["variables"]["Z"],
-                        value=0.0)
-    I = st.number_input("Importance Factor (I)",
-                        help=YEAR_DESCRIPTIONS[2025]["variables"]["I"],
-                        value=1.0)
-    R = st.number_input("Ductility Factor (R)",
-                        help=YEAR_DESCRIPTIONS[2025]["variables"]["R"],
-                        value=1.0)
-    A_NH = st.number_input("Horizontal Response Coefficient (A_NH)",
-                           help=YEAR_DESCRIPTIONS[2025]["variables"]["A_NH"],
-                           value=0.0)
-    A_NV = st.number_input("Vertical Response Coefficient (A_NV)",
-                           help=YEAR_DESCRIPTIONS[2025]["variables"]["A_NV"],
-                           value=0.0)
-    W = st.number_input("Seismic Weight W (kN)",
-                        help=YEAR_DESCRIPTIONS[2025]["variables"]["W"],
-                        value=0.0)
-
-    if st.button("Calculate"):
-        VBD_H = (Z * I * A_NH / R) * W
-        VBD_V = (Z * I * A_NV) * W
-        st.session_state["numeric_result"] = {
-            "VBD,H (kN)": VBD_H,
-            "VBD,V (kN)": VBD_V
-        }
-        st.session_state["values"] = {
-            "Z": Z, "I": I, "R": R, "A_NH": A_NH, "A_NV": A_NV, "W (kN)": W
-        }
+spec = YEAR_SPECS[year]
+
+variable_help = description["variables"]
+
+# Inputs are batched in a form so editing them does not rerun the script
+with st.form(f"calc_{year}"):
+    inputs = {}
+    for key, label, help_key, default in spec["inputs"]:
+        inputs[key] = st.number_input(label, help=variable_help[help_key], value=default)
+
+    submitted = st.form_submit_button("Calculate")
+
+if submitted:
+    outputs = spec["compute"](*inputs.values())
+    if not isinstance(outputs, tuple):
+        outputs = (outputs,)
+    st.session_state["numeric_result"] = dict(zip(spec["results"], outputs))
+    st.session_state["values"] = inputs
+    st.session_state["formula_text"] = spec["formula"]
+    st.session_state["year"] = year
+    st.session_state["distribution"] = None
+    st.session_state["pdf_future"] = None
+
+# Results persist across reruns; read them once for the sections below
+numeric_result = st.session_state["numeric_result"]
+values = st.session_state["values"]
+formula_text = st.session_state["formula_text"] or spec["formula"]
 
 # ==============================
 # DISPLAY
@@ -365,62 +355,59 @@ st.subheader("Formula Used")
 st.code(formula_text)
 
 st.subheader("Entered Values")
-st.write(st.session_state["values"])
+st.write(values)
 
 st.subheader("Result")
-st.write(st.session_state["numeric_result"])
+st.write(numeric_result)
 
 # ==============================
 # BASE SHEAR DISTRIBUTION GRAPH (FIXED)
 # ==============================
-if st.session_state["numeric_result"]:
+def _storey_shear(storeys: int, total_shear: float):
+    storey_list = np.arange(1, storeys + 1)
+    shear = storey_list * (total_shear / storeys)
+    return storey_list, shear
+
+
+if numeric_result:
     st.subheader("Base Shear Distribution (Storey-wise)")
 
     storeys = st.number_input("Number of Storeys", min_value=1, step=1)
 
     if st.button("Generate Distribution Graph"):
-        total_shear = list(st.session_state["numeric_result"].values())[0]
-        storey_list = list(range(1, storeys + 1))
-        shear = [(i / storeys) * total_shear for i in storey_list]
-
-        fig, ax = plt.subplots()
-        ax.bar(storey_list, shear)
-        ax.set_xlabel("Storey")
-        ax.set_ylabel("Shear (kN)")
-        ax.set_title("Linear Base Shear Distribution")
-
-        st.pyplot(fig)
-        plt.close(fig)
-
-        # Save graph to memory for PDF
-        img_buffer = BytesIO()
-        fig2, ax2 = plt.subplots()
-        ax2.bar(storey_list, shear)
-        ax2.set_xlabel("Storey")
-        ax2.set_ylabel("Shear (kN)")
-        ax2.set_title("Linear Base Shear Distribution")
-        fig2.savefig(img_buffer, format="png", dpi=150)
-        plt.close(fig2)
-        img_buffer.seek(0)
-        st.session_state["graph_image"] = img_buffer
+        total_shear = list(numeric_result.values())[0]
+
+        # Keep distribution inputs for the PDF, which draws its own vector chart
+        st.session_state["distribution"] = (int(storeys), float(total_shear))
+        st.session_state["pdf_future"] = None
+
+    if st.session_state["distribution"] is not None:
+        # Drawn client-side by Streamlit; no server-side Matplotlib render
+        storey_list, shear = _storey_shear(*st.session_state["distribution"])
+        st.bar_chart(pd.DataFrame({"Shear (kN)": shear},
+                                  index=pd.Index(storey_list, name="Storey")))
 
 # ==============================
 # EXPORT TO EXCEL
 # ==============================
-if st.session_state["numeric_result"]:
-    st.subheader("Export Result (Excel)")
-
-    df = pd.DataFrame(list(st.session_state["values"].items()), columns=["Parameter", "Value"])
-    for k, v in st.session_state["numeric_result"].items():
-        df.loc[len(df)] = [k, v]
+@st.cache_data
+def _build_xlsx(values_items: tuple, result_items: tuple) -> bytes:
+    # Workbook is rebuilt only when the entered values or results change
+    rows = list(values_items) + list(result_items)
+    df = pd.DataFrame(rows, columns=["Parameter", "Value"])
 
     excel_buffer = BytesIO()
     with pd.ExcelWriter(excel_buffer, engine="xlsxwriter") as writer:
         df.to_excel(writer, index=False, sheet_name="Result")
+    return excel_buffer.getvalue()
+
+
+if numeric_result:
+    st.subheader("Export Result (Excel)")
 
     st.download_button(
         label="Download Result as Excel",
-        data=excel_buffer.getvalue(),
+        data=_build_xlsx(tuple(values.items()), tuple(numeric_result.items())),
         file_name="seismic_result.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
@@ -428,74 +415,234 @@ if st.session_state["numeric_result"]:
 # ==============================
 # WATERMARK FUNCTION
 # ==============================
+WATERMARK_FORM = "watermark"
+
+
 def add_watermark(canvas, doc):
-    canvas.saveState()
-    canvas.setFont('Helvetica', 36)
-    canvas.setFillColor(lightgrey)
-    canvas.translate(300, 400)
-    canvas.rotate(45)
-    canvas.drawCentredString(0, 0, f"{AUTHOR_NAME} - {INSTITUTE_NAME}")
-    canvas.restoreState()
+    # Draw the watermark once per document as a form XObject, then stamp it on each page
+    if not canvas.hasForm(WATERMARK_FORM):
+        from reportlab.lib.colors import lightgrey
+
+        canvas.beginForm(WATERMARK_FORM)
+        canvas.saveState()
+        canvas.setFont('Helvetica', 36)
+        canvas.setFillColor(lightgrey)
+        canvas.translate(300, 400)
+        canvas.rotate(45)
+        canvas.drawCentredString(0, 0, f"{AUTHOR_NAME} - {INSTITUTE_NAME}")
+        canvas.restoreState()
+        canvas.endForm()
+
+    canvas.doForm(WATERMARK_FORM)
 
 # ==============================
-# FULL PDF EXPORT (FIXED)
+# PDF DISTRIBUTION CHART (NATIVE REPORTLAB)
 # ==============================
-if st.session_state["numeric_result"] and st.session_state["graph_image"] is not None:
-    st.subheader("Download Full PDF Report")
-
-    if st.button("Generate PDF Report"):
-        pdf_buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            pdf_buffer,
-            pagesize=A4,
-            onFirstPage=add_watermark,
-            onLaterPages=add_watermark
-        )
+def _distribution_drawing(storeys: int, total_shear: float, width: float, height: float):
+    # Vector bar chart drawn by ReportLab: no Matplotlib raster or PNG round-trip
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+
+    storey_list, shear = _storey_shear(storeys, total_shear)
+    label_step = max(1, storeys // 10)
+
+    drawing = Drawing(width, height)
+    chart = VerticalBarChart()
+    chart.x = 50
+    chart.y = 35
+    chart.width = width - 60
+    chart.height = height - 75
+    chart.data = [shear.tolist()]
+    chart.categoryAxis.categoryNames = [
+        str(i) if (i - 1) % label_step == 0 else "" for i in storey_list
+    ]
+    # Bars start at zero, as in the on-screen chart, whatever the sign of the shear
+    chart.valueAxis.forceZero = 1
+    drawing.add(chart)
+    drawing.add(String(width / 2, height - 14, "Linear Base Shear Distribution",
+                       textAnchor="middle", fontName="Helvetica-Bold", fontSize=11))
+    drawing.add(String(chart.x, chart.y + chart.height + 8, "Shear (kN)", textAnchor="middle"))
+    drawing.add(String(chart.x + chart.width / 2, 5, "Storey", textAnchor="middle"))
+    return drawing
 
-        styles = getSampleStyleSheet()
-        story = []
 
-        timestamp = datetime.datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-        user_display = user_tag if user_tag.strip() != "" else "Not Provided"
-
-        story.append(Paragraph("<b>IS 1893 Seismic Calculation Report</b>", styles["Title"]))
-        story.append(Spacer(1, 12))
-
-        story.append(Paragraph(f"<b>Author:</b> {AUTHOR_NAME}", styles["Normal"]))
-        story.append(Paragraph(f"<b>Institute:</b> {INSTITUTE_NAME}", styles["Normal"]))
-        story.append(Paragraph(f"<b>User:</b> {user_display}", styles["Normal"]))
-        story.append(Paragraph(f"<b>Timestamp:</b> {timestamp}", styles["Normal"]))
-        story.append(Spacer(1, 12))
-
-        story.append(Paragraph(f"<b>Code Year:</b> {year}", styles["Normal"]))
-        story.append(Paragraph(f"<b>Formula Used:</b> {formula_text}", styles["Normal"]))
-        story.append(Spacer(1, 12))
-
-        story.append(Paragraph("<b>Entered Values:</b>", styles["Heading2"]))
-        for k, v in st.session_state["values"].items():
-            story.append(Paragraph(f"{k} = {v}", styles["Normal"]))
+# ==============================
+# PDF STYLES + STATIC HEADER (BUILT ONCE)
+# ==============================
+@st.cache_resource
+def _pdf_styles():
+    from reportlab.lib.styles import getSampleStyleSheet
+    return getSampleStyleSheet()
+
+
+@st.cache_resource
+def _pdf_header():
+    # Input-independent flowables; markup is parsed once per process
+    from reportlab.platypus import Paragraph, Spacer
+
+    styles = _pdf_styles()
+    return [
+        Paragraph("<b>IS 1893 Seismic Calculation Report</b>", styles["Title"]),
+        Spacer(1, 12),
+        Paragraph(f"<b>Author:</b> {AUTHOR_NAME}", styles["Normal"]),
+        Paragraph(f"<b>Institute:</b> {INSTITUTE_NAME}", styles["Normal"]),
+    ]
+
+
+@st.cache_resource
+def _pdf_section_titles():
+    from reportlab.platypus import Paragraph
+
+    heading = _pdf_styles()["Heading2"]
+    return {
+        "table": Paragraph("<b>Entered Values and Result:</b>", heading),
+        "distribution": Paragraph("<b>Base Shear Distribution:</b>", heading),
+    }
 
-        story.append(Spacer(1, 12))
 
-        story.append(Paragraph("<b>Result:</b>", styles["Heading2"]))
-        for k, v in st.session_state["numeric_result"].items():
-            story.append(Paragraph(f"{k} = {v:.4f} kN", styles["Normal"]))
+# ==============================
+# FULL PDF EXPORT (FIXED)
+# ==============================
+def _build_pdf(*, styles, header: list, titles: dict,
+               year: int, formula: str, values_items: tuple, result_items: tuple,
+               storeys: int, total_shear: float, user: str, ts_bucket: str) -> bytes:
+    # Runs on a worker thread: the cached ReportLab resources are passed in
+    # and nothing here touches Streamlit
+    # ReportLab is imported here so sessions that never export skip its import cost
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib.colors import lightgrey
+
+    pdf_buffer = BytesIO()
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=A4)
+
+    normal = styles["Normal"]
+
+    # Plain-text rows go in one Table so no per-row Paragraph markup parsing is needed
+    table_data = (
+        [["Parameter", "Value"]]
+        + [[k, f"{v}"] for k, v in values_items]
+        + [[k, f"{v:.4f} kN"] for k, v in result_items]
+    )
+    table = Table(table_data, hAlign="LEFT")
+    table.setStyle(TableStyle([
+        ("FONT", (0, 0), (-1, -1), "Helvetica", 10),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("GRID", (0, 0), (-1, -1), 0.25, lightgrey),
+    ]))
+
+    # Shallow copies keep per-build layout state off the cached flowables
+    story = [copy.copy(f) for f in header]
+    story.extend([
+        Paragraph(f"<b>User:</b> {user}<br/><b>Timestamp:</b> {ts_bucket}", normal),
+        Spacer(1, 12),
+
+        Paragraph(f"<b>Code Year:</b> {year}<br/><b>Formula Used:</b> {formula}", normal),
+        Spacer(1, 12),
+
+        copy.copy(titles["table"]),
+        table,
+        Spacer(1, 12),
+
+        copy.copy(titles["distribution"]),
+        _distribution_drawing(storeys, total_shear, 4 * inch, 3 * inch),
+    ])
+
+    doc.build(story, onFirstPage=add_watermark, onLaterPages=add_watermark)
+    return pdf_buffer.getvalue()
+
+
+@st.cache_resource
+def _pdf_pool():
+    return ThreadPoolExecutor(max_workers=2)
+
+
+@st.cache_resource
+def _pdf_cache():
+    # Finished report bytes keyed on report inputs, shared across sessions
+    return {}, threading.Lock()
+
+
+def _submit_pdf(**report) -> Future:
+    # ts_bucket is minute-resolution so repeat clicks within a minute hit the cache
+    cache, lock = _pdf_cache()
+    key = tuple(sorted(report.items()))
+
+    with lock:
+        pdf_bytes = cache.get(key)
+    if pdf_bytes is not None:
+        future = Future()
+        future.set_result(pdf_bytes)
+        return future
+
+    def _store(done):
+        if done.exception() is None:
+            with lock:
+                cache[key] = done.result()
+                while len(cache) > 8:
+                    cache.pop(next(iter(cache)))
+
+    # Cached resources are resolved on the script thread; the worker gets plain objects
+    future = _pdf_pool().submit(
+        _build_pdf,
+        styles=_pdf_styles(),
+        header=_pdf_header(),
+        titles=_pdf_section_titles(),
+        **report
+    )
+    future.add_done_callback(_store)
+    return future
 
-        story.append(Spacer(1, 12))
 
-        story.append(Paragraph("<b>Base Shear Distribution:</b>", styles["Heading2"]))
-        img = RLImage(st.session_state["graph_image"], width=4 * inch, height=3 * inch)
-        story.append(img)
+def _pdf_status(polling: bool):
+    # Polled as a fragment so only this block reruns while the build is pending
+    future = st.session_state["pdf_future"]
+    if future is None:
+        return
 
-        doc.build(story)
+    if polling and future.done():
+        # One full rerun re-registers the fragment without run_every, ending the polling
+        st.rerun()
 
+    if not future.done():
+        st.info("Generating PDF report...")
+    elif future.exception() is not None:
+        st.error(f"PDF generation failed: {future.exception()}")
+    else:
         st.download_button(
             label="Download PDF Report",
-            data=pdf_buffer.getvalue(),
+            data=future.result(),
             file_name="Seismic_Full_Report.pdf",
             mime="application/pdf"
         )
 
+
+if numeric_result and st.session_state["distribution"] is not None:
+    st.subheader("Download Full PDF Report")
+
+    if st.button("Generate PDF Report"):
+        timestamp = datetime.datetime.now().strftime("%d-%m-%Y %H:%M")
+        user_display = user_tag if user_tag.strip() != "" else "Not Provided"
+
+        report_storeys, report_shear = st.session_state["distribution"]
+
+        # Built off the script thread so the page stays responsive
+        st.session_state["pdf_future"] = _submit_pdf(
+            year=st.session_state["year"],
+            formula=formula_text,
+            values_items=tuple(values.items()),
+            result_items=tuple(numeric_result.items()),
+            storeys=report_storeys,
+            total_shear=report_shear,
+            user=user_display,
+            ts_bucket=timestamp
+        )
+
+    future = st.session_state["pdf_future"]
+    pending = future is not None and not future.done()
+    st.fragment(_pdf_status, run_every=1 if pending else None)(pending)
+
 # ==============================
 # FOOTER
 # ==============================